@@ -1,4 +1,5 @@
 import os
+import shutil
 import subprocess
 
 # Define the main script and output file name
@@ -26,9 +27,8 @@ subprocess.run(command, check=True)
 
 # Clean up build files
 print("Cleaning up temporary files...")
-for folder in ["build", "__pycache__"]:
-    if os.path.exists(folder):
-        os.system(f"rmdir /s /q {folder}")  # Windows-specific command to remove directories
+for folder in ("build", "__pycache__"):
+    shutil.rmtree(folder, ignore_errors=True)  # Portable, no shell subprocess needed
 if os.path.exists(f"{output_name}.spec"):
     os.remove(f"{output_name}.spec")
 
@@ -1,4 +1,5 @@
 from random import randint
+from types import SimpleNamespace
 from typing import Dict, Union, Optional, Tuple, Any, List
 from src.game.entities.items import Item, Armor, Weapon, weapon_dictionary, armor_dictionary
 from src.game.entities.ability import Ability
@@ -12,6 +13,51 @@ import pygame
 PotionBag = Dict[str, int]
 HeroDict = Dict[str, Any]
 
+# The only potion names a hero can carry; draw and the battle UI read
+# exactly these keys, so unknown names must never enter the potion bag.
+_POTION_KEYS: Tuple[str, ...] = ("Health Potion", "Damage Potion", "Block Potion")
+
+# Static HUD labels rendered once per font and shared by every hero.
+_LABEL_CACHE: Dict[Tuple[int, str], pygame.Surface] = {}
+
+def _label(font: pygame.font.Font, text: str) -> pygame.Surface:
+    """
+    Get a rendered label surface, rendering it only on first use per font.
+
+    Args:
+        font: Font to render with
+        text: Label text to render
+
+    Returns:
+        The cached label surface
+    """
+    key = (id(font), text)
+    surf = _LABEL_CACHE.get(key)
+    if surf is None:
+        surf = font.render(text, True, Colors.BLACK)
+        _LABEL_CACHE[key] = surf
+    return surf
+
+# Shared class portraits, loaded and scaled once then reused by every hero.
+_PORTRAIT_CACHE: Dict[str, pygame.Surface] = {}
+
+def _portrait(name: str) -> pygame.Surface:
+    """
+    Get the shared 100x100 portrait surface for a hero class.
+
+    Args:
+        name: Base name of the portrait image (e.g. "knight")
+
+    Returns:
+        The cached portrait surface, loading and scaling it on first use
+    """
+    portrait = _PORTRAIT_CACHE.get(name)
+    if portrait is None:
+        portrait = pygame.image.load(resource_path(f"src\\game\\assets\\images\\{name}.png")).convert()
+        portrait = pygame.transform.scale(portrait, (100, 100))
+        _PORTRAIT_CACHE[name] = portrait
+    return portrait
+
 class Hero(Combatant):
     """Base class for all heroes in the game."""
 
@@ -46,6 +92,7 @@ class Hero(Combatant):
             "Damage Potion": 1,
             "Block Potion": 1,
         }
+        self._potion_count: int = sum(self.potion_bag.values())
         self.potion_damage: int = 0
         self.potion_block: int = 0
         self.border_color: Colors = border_color
@@ -54,6 +101,17 @@ class Hero(Combatant):
         self.abilities: List[Ability] = []
         self.energy: int = 10
         self.max_energy: int = 10
+        # Cache of rendered stat text, keyed by label -> (text, surface).
+        # Surfaces are only re-rendered when the underlying text changes.
+        self._text_cache: Dict[str, Tuple[str, pygame.Surface]] = {}
+        # Cached draw layout, rebuilt only when position, font, or image change.
+        self._layout_key: Optional[Tuple] = None
+        self._layout: Optional[SimpleNamespace] = None
+        # Pre-composited static panel background (portrait, equipment, borders).
+        self._static_bg: Optional[pygame.Surface] = None
+        # Fully composited hero panel, re-rendered only after a stat changes.
+        self._panel_surface: Optional[pygame.Surface] = None
+        self._dirty: bool = True
 
         self.add_ability("Strike")  # Default ability for all heroes
 
@@ -86,6 +144,7 @@ class Hero(Combatant):
         if self.armor:
             incoming_damage = self.armor.calculate_defence(incoming_damage)
         super().take_damage(incoming_damage)
+        self._dirty = True
 
     def rest(self) -> None:
         """
@@ -98,6 +157,7 @@ class Hero(Combatant):
             self.current_hp = self.max_hp
 
         self.update_abilities()
+        self._dirty = True
 
     def add_item(self, item: Item) -> None:
         """
@@ -108,16 +168,20 @@ class Hero(Combatant):
         """
         if isinstance(item, Weapon):
             self.weapon = item
+            self._static_bg = None
+            self._dirty = True
             print(f"{self.name} equipped a {item.name}!")
         elif isinstance(item, Armor):
             self.armor = item
+            self._static_bg = None
+            self._dirty = True
             print(f"{self.name} equipped a {item.name}!")
         elif isinstance(item, Item):
             self.add_potion(item.name, 1)
 
     def has_potions(self) -> bool:
-        return any(amount > 0 for amount in self.potion_bag.values())
-    
+        return self._potion_count > 0
+
     def add_potion(self, potion_name: str, amount: int) -> None:
         """
         Add a potion to the hero's inventory.
@@ -126,10 +190,12 @@ class Hero(Combatant):
             potion_name: Name of the potion to add
             amount: Number of potions to add
         """
-        if potion_name in self.potion_bag:
-            self.potion_bag[potion_name] += amount
-        else:
-            self.potion_bag[potion_name] = amount
+        if potion_name not in _POTION_KEYS:
+            print(f"Unknown potion: {potion_name}")
+            return
+        self.potion_bag[potion_name] += amount
+        self._potion_count += amount
+        self._dirty = True
         print(f"{amount} {potion_name}(s) added to your inventory!")
 
     def use_potion(self, potion_name: str) -> None:
@@ -152,6 +218,8 @@ class Hero(Combatant):
                 self.potion_block = 2
                 print(f"{self.name} used a Block Potion! Block increased by {self.potion_block}.")
             self.potion_bag[potion_name] -= 1
+            self._potion_count -= 1
+            self._dirty = True
         else:
             print(f"You don't have any {potion_name}(s) left!")
 
@@ -163,12 +231,14 @@ class Hero(Combatant):
             amount: Amount of gold to add
         """
         self.gold += amount
+        self._dirty = True
         print(f"You gained {amount} gold! Total gold: {self.gold}")
 
     def spend_gold(self, amount) -> bool:
         """Spend gold from the hero's inventory."""
         if self.gold >= amount:
             self.gold -= amount
+            self._dirty = True
             print(f"You spent {amount} gold. Remaining gold: {self.gold}")
             return True
         else:
@@ -178,6 +248,7 @@ class Hero(Combatant):
     def gain_experience(self, experience:int):
         """Gain experience points."""
         self.experience += experience
+        self._dirty = True
         if self.experience >= (10 * self.level):
             self.experience = 0
             self.level_up()
@@ -188,6 +259,7 @@ class Hero(Combatant):
         self.current_hp = self.max_hp
         self.energy = min(self.energy + 2, self.max_energy)
         self.level += 1
+        self._dirty = True
         print(self.name + " has leveled up!")
 
     def __str__(self):
@@ -211,6 +283,7 @@ class Hero(Combatant):
 
         if ability not in self.abilities:
             self.abilities.append(ability)
+            self._dirty = True
             print(f"{self.name} learned {ability_name}!")
         else:
             print(f"{self.name} already knows {ability_name}!")
@@ -225,6 +298,7 @@ class Hero(Combatant):
         for ability in self.abilities:
             if ability.name == ability_name:
                 self.abilities.remove(ability)
+                self._dirty = True
                 print(f"{self.name} forgot {ability_name}!")
                 return
         print(f"{self.name} doesn't know {ability_name}!")
@@ -251,6 +325,7 @@ class Hero(Combatant):
                 
                 effect = ability.use(self, target)
                 self.energy -= ability.energy_cost
+                self._dirty = True
                 
                 # Print appropriate message based on the effect
                 if hasattr(effect, 'missed') and effect.missed:
@@ -273,6 +348,7 @@ class Hero(Combatant):
         """Update cooldowns of all abilities at the end of turn."""
         for ability in self.abilities:
             ability.update_cooldown()
+        self._dirty = True
 
     def restore_energy(self, amount: int) -> None:
         """
@@ -282,6 +358,7 @@ class Hero(Combatant):
             amount: Amount of energy to restore
         """
         self.energy = min(self.energy + amount, self.max_energy)
+        self._dirty = True
 
     def to_dict(self) -> HeroDict:
         """
@@ -323,97 +400,240 @@ class Hero(Combatant):
         self.weapon = weapon_dictionary[data["weapon"]] if data["weapon"] else None
         self.armor = armor_dictionary[data["armor"]] if data["armor"] else None
         self.potion_bag = data["potion_bag"]
+        self._potion_count = sum(self.potion_bag.values())
         self.abilities = []
         for ability_name in data.get("abilities", []):
             self.add_ability(ability_name)
         self.energy = data.get("energy", 10)
         self.max_energy = data.get("max_energy", 10)
         if self.class_name == "Knight":
-            self.image = pygame.image.load(resource_path("src\\game\\assets\\images\\knight.png")).convert()
+            self.image = _portrait("knight")
         else:
-            self.image = pygame.image.load(resource_path("src\\game\\assets\\images\\assassin.png")).convert()
-        self.image = pygame.transform.scale(self.image, (100, 100))
+            self.image = _portrait("assassin")
+        self._static_bg = None
+        self._dirty = True
 
         self.add_ability("Strike")
 
-    def draw(self, surface: pygame.Surface, font: pygame.font.Font, 
-            x: int = 0, y: int = 0) -> None:
+    def _cached_render(self, key: str, text: str, font: pygame.font.Font,
+                       color: Tuple[int, int, int]) -> pygame.Surface:
         """
-        Draw the hero and their stats on the given surface.
-        
+        Return a rendered text surface, re-rendering only when the text changes.
+
         Args:
-            surface: Pygame surface to draw on
-            font: Font to use for text
+            key: Cache key identifying this piece of text
+            text: Text to render
+            font: Font to use for rendering
+            color: RGB color tuple for the text
+
+        Returns:
+            The cached (or freshly rendered) text surface
+        """
+        cached = self._text_cache.get(key)
+        if cached is None or cached[0] != text:
+            cached = (text, font.render(text, True, color))
+            self._text_cache[key] = cached
+        return cached[1]
+
+    def _blit_cached_lines(self, key: str, text: str, font: pygame.font.Font,
+                           color: Tuple[int, int, int], surface: pygame.Surface,
+                           x: int, y: int) -> None:
+        """
+        Blit multiple lines of cached text on the given surface.
+
+        Args:
+            key: Cache key prefix for this block of text
+            text: Text to draw (lines separated by newlines)
+            font: Font to use for rendering
+            color: RGB color tuple for the text
+            surface: Surface to draw on
             x: X coordinate to draw at
             y: Y coordinate to draw at
         """
-        # Border
-        hero_border = pygame.Rect(x, y, GameConstants.SCREEN_WIDTH // 2, GameConstants.SCREEN_HEIGHT // 2 - 50)
+        linesize = font.get_linesize()
+        for i, line in enumerate(text.split("\n")):
+            surface.blit(self._cached_render(f"{key}:{i}", line, font, color),
+                         (x, y + i * linesize))
 
-        # Hero Name
-        draw_text(self.name, font, Colors.BLACK, surface, hero_border.x + 20, hero_border.y + 10)
+    def _get_layout(self, x: int, y: int, font: pygame.font.Font) -> SimpleNamespace:
+        """
+        Get the cached draw layout, rebuilding it only when position, font,
+        screen size, or image size change.
 
-        # Hero Image
-        surface.blit(self.image, (hero_border.x + 10, hero_border.y + font.get_linesize() + 10))
+        Args:
+            x: X coordinate of the hero panel
+            y: Y coordinate of the hero panel
+            font: Font to use for text
+
+        Returns:
+            Namespace holding all the Rects and coordinates used by draw
+        """
+        key = (x, y, id(font), GameConstants.SCREEN_WIDTH, GameConstants.SCREEN_HEIGHT,
+               self.image.get_width(), self.image.get_height())
+        if key != self._layout_key:
+            linesize = font.get_linesize()
+            hero_border = pygame.Rect(x, y, GameConstants.SCREEN_WIDTH // 2,
+                                      GameConstants.SCREEN_HEIGHT // 2 - 50)
+            weapon_border = pygame.Rect(hero_border.x + hero_border.width // 2,
+                                        hero_border.y, hero_border.width // 2,
+                                        hero_border.height // 3)
+            armor_border = pygame.Rect(hero_border.x + hero_border.width // 2,
+                                       hero_border.y + hero_border.height // 3,
+                                       hero_border.width // 2,
+                                       hero_border.height // 3 * 2)
+            health_bar_height = linesize + 4
+            health_bar_y = hero_border.y + linesize + self.image.get_height() + 15
+            energy_bar_y = health_bar_y + health_bar_height + 5
+            self._layout = SimpleNamespace(
+                hero_border=hero_border,
+                weapon_border=weapon_border,
+                armor_border=armor_border,
+                name_pos=(hero_border.x + 20, hero_border.y + 10),
+                image_pos=(hero_border.x + 10, hero_border.y + linesize + 10),
+                health_bar_x=hero_border.x + 15,
+                health_bar_y=health_bar_y,
+                health_bar_width=90,
+                health_bar_height=health_bar_height,
+                energy_bar_y=energy_bar_y,
+                stats_pos=(hero_border.x + self.image.get_width() + 10,
+                           hero_border.y + linesize + 20),
+                abilities_pos=(hero_border.x + 10,
+                               energy_bar_y + health_bar_height + 10),
+                weapon_name_center=(weapon_border.x + weapon_border.width // 2,
+                                    weapon_border.y + linesize // 2 + 10),
+                weapon_stats_pos=(weapon_border.x + 10, weapon_border.y + linesize + 25),
+                armor_name_center=(armor_border.x + armor_border.width // 2,
+                                   armor_border.y + linesize // 2 + 10),
+                armor_stats_pos=(armor_border.x + 10, armor_border.y + linesize + 25),
+            )
+            self._layout_key = key
+            self._static_bg = None
+        return self._layout
+
+    def _build_static_bg(self, layout: SimpleNamespace, font: pygame.font.Font) -> pygame.Surface:
+        """
+        Composite the static parts of the hero panel into a single surface.
+
+        The portrait, equipped weapon/armor text, and borders only change when
+        equipment changes, so they are drawn once here and re-blitted as one
+        surface per frame.
+
+        Args:
+            layout: The cached draw layout for the panel
+            font: Font to use for text
+
+        Returns:
+            A panel-sized surface holding the static background
+        """
+        border = layout.hero_border
+        bg = pygame.Surface((border.width, border.height), pygame.SRCALPHA)
+        offset_x, offset_y = -border.x, -border.y
+
+        bg.blit(self.image, (layout.image_pos[0] + offset_x, layout.image_pos[1] + offset_y))
+
+        if self.weapon is not None:
+            draw_text_centered(self.weapon.name, font, Colors.BLACK, bg,
+                               layout.weapon_name_center[0] + offset_x,
+                               layout.weapon_name_center[1] + offset_y)
+            draw_multiple_lines(f"Damage {self.weapon.damage}", font, Colors.BLACK, bg,
+                                layout.weapon_stats_pos[0] + offset_x,
+                                layout.weapon_stats_pos[1] + offset_y)
+            pygame.draw.rect(bg, Colors.LIGHT_RED, layout.weapon_border.move(offset_x, offset_y),
+                             width=3, border_radius=10)
+
+        if self.armor is not None:
+            draw_text_centered(self.armor.name, font, Colors.BLACK, bg,
+                               layout.armor_name_center[0] + offset_x,
+                               layout.armor_name_center[1] + offset_y)
+            armor_text = f"Block: {self.armor.block}\nChance: {self.armor.block_chance:.0%}\nDodge: {self.armor.dodge_chance:.0%}"
+            draw_multiple_lines(armor_text, font, Colors.BLACK, bg,
+                                layout.armor_stats_pos[0] + offset_x,
+                                layout.armor_stats_pos[1] + offset_y)
+            pygame.draw.rect(bg, Colors.LIGHT_BLUE, layout.armor_border.move(offset_x, offset_y),
+                             width=3, border_radius=10)
+
+        pygame.draw.rect(bg, Colors.BLUE, pygame.Rect(0, 0, border.width, border.height),
+                         width=5, border_radius=10)
+        return bg
+
+    def _render_panel(self, font: pygame.font.Font) -> None:
+        """
+        Re-render the full hero panel into the persistent panel surface.
+
+        Args:
+            font: Font to use for text
+        """
+        layout = self._get_layout(0, 0, font)
+        border = layout.hero_border
+        linesize = font.get_linesize()
+        # The abilities block extends below the bordered area, so size the
+        # panel to the full content height rather than the border alone.
+        panel_size = (border.width,
+                      max(border.height,
+                          layout.abilities_pos[1] + (1 + len(self.abilities)) * linesize))
+        if self._panel_surface is None or self._panel_surface.get_size() != panel_size:
+            self._panel_surface = pygame.Surface(panel_size, pygame.SRCALPHA)
+        panel = self._panel_surface
+        panel.fill((0, 0, 0, 0))
+
+        # Static background: portrait, equipment text, and borders in one blit
+        if self._static_bg is None:
+            self._static_bg = self._build_static_bg(layout, font)
+        panel.blit(self._static_bg, (0, 0))
+
+        # Hero Name
+        panel.blit(self._cached_render("name", self.name, font, Colors.BLACK),
+                   layout.name_pos)
 
-        # Health and Energy Bars
-        health_bar_width = 90
-        health_bar_height = font.get_linesize() + 4
-        health_bar_x = hero_border.x + 15
-        health_bar_y = hero_border.y + font.get_linesize() + self.image.get_height() + 15
-        
         # Draw Health Bar
-        draw_health_bar(surface, font, health_bar_x, health_bar_y, health_bar_width, health_bar_height, 
+        draw_health_bar(panel, font, layout.health_bar_x, layout.health_bar_y,
+                        layout.health_bar_width, layout.health_bar_height,
                         self.current_hp, self.max_hp)
-        
+
         # Draw Energy Bar
-        energy_bar_y = health_bar_y + health_bar_height + 5
-        draw_energy_bar(surface, font, health_bar_x, energy_bar_y, health_bar_width, health_bar_height,
+        draw_energy_bar(panel, font, layout.health_bar_x, layout.energy_bar_y,
+                        layout.health_bar_width, layout.health_bar_height,
                         self.energy, self.max_energy)
 
-        # Hero Stats
-        hero_text = f"Level: {self.level}\nExp: {self.experience}\nGold: {self.gold}"
-        draw_multiple_lines(hero_text, font, Colors.BLACK, surface, 
-                            hero_border.x + self.image.get_width() + 10, 
-                            hero_border.y + font.get_linesize() + 20)
+        # Hero Stats: static labels render once, values only when they change
+        stats_x, stats_y = layout.stats_pos
+        for i, (label_text, value_key, value) in enumerate((
+                ("Level: ", "level_val", self.level),
+                ("Exp: ", "exp_val", self.experience),
+                ("Gold: ", "gold_val", self.gold))):
+            row_label = _label(font, label_text)
+            row_y = stats_y + i * linesize
+            panel.blit(row_label, (stats_x, row_y))
+            panel.blit(self._cached_render(value_key, str(value), font, Colors.BLACK),
+                       (stats_x + row_label.get_width(), row_y))
 
         # Draw Abilities
         ability_text = "Abilities:"
         for ability in self.abilities:
             cooldown_text = f" ({ability.current_cooldown})" if ability.current_cooldown > 0 else ""
             ability_text += f"\n-{ability.name} ({ability.energy_cost} energy){cooldown_text}"
-        
-        draw_multiple_lines(ability_text, font, Colors.BLACK, surface,
-                            hero_border.x + 10,
-                            energy_bar_y + health_bar_height + 10)
 
-        # Draw the hero's weapon and armor
-        if self.weapon is not None:
-            weapon_border = pygame.Rect(hero_border.x + hero_border.width // 2, 
-                                     hero_border.y, hero_border.width // 2, 
-                                     hero_border.height // 3)
-            draw_text_centered(self.weapon.name, font, Colors.BLACK, surface,
-                             weapon_border.x + weapon_border.width // 2,
-                             weapon_border.y + font.get_linesize() // 2 + 10)
-            draw_multiple_lines(f"Damage {self.weapon.damage}", font, Colors.BLACK, surface,
-                                weapon_border.x + 10, weapon_border.y + font.get_linesize() + 25)
-            pygame.draw.rect(surface, Colors.LIGHT_RED, weapon_border, width=3, border_radius=10)
+        self._blit_cached_lines("abilities", ability_text, font, Colors.BLACK, panel,
+                                *layout.abilities_pos)
 
-        if self.armor is not None:
-            armor_border = pygame.Rect(hero_border.x + hero_border.width // 2,
-                                        hero_border.y + hero_border.height // 3,
-                                        hero_border.width // 2,
-                                        hero_border.height // 3 * 2)
-            draw_text_centered(self.armor.name, font, Colors.BLACK, surface,
-                                armor_border.x + armor_border.width // 2,
-                                armor_border.y + font.get_linesize() // 2 + 10)
-            armor_text = f"Block: {self.armor.block}\nChance: {self.armor.block_chance:.0%}\nDodge: {self.armor.dodge_chance:.0%}"
-            draw_multiple_lines(armor_text, font, Colors.BLACK, surface,
-                                armor_border.x + 10,
-                                armor_border.y + font.get_linesize() + 25)
-            pygame.draw.rect(surface, Colors.LIGHT_BLUE, armor_border, width=3, border_radius=10)
-        
-        pygame.draw.rect(surface, Colors.BLUE, hero_border, width=5, border_radius=10)
+    def draw(self, surface: pygame.Surface, font: pygame.font.Font,
+            x: int = 0, y: int = 0) -> None:
+        """
+        Draw the hero and their stats on the given surface.
+
+        The panel is only re-rendered when a stat has changed since the last
+        draw; idle frames cost a single blit.
+
+        Args:
+            surface: Pygame surface to draw on
+            font: Font to use for text
+            x: X coordinate to draw at
+            y: Y coordinate to draw at
+        """
+        if self._dirty or self._panel_surface is None:
+            self._render_panel(font)
+            self._dirty = False
+        surface.blit(self._panel_surface, (x, y))
 
 class Assassin(Hero):
     """A class representing a Assassin hero."""
@@ -425,8 +645,7 @@ class Assassin(Hero):
         Args:
             name: The assassin's name
         """
-        image = pygame.image.load(resource_path("src\\game\\assets\\images\\assassin.png")).convert()
-        image = pygame.transform.scale(image, (100, 100))
+        image = _portrait("assassin")
         health = randint(7, 12)
         weapon = weapon_dictionary["Iron Knife"]
         armor = armor_dictionary["Shadow Cloak"]
@@ -445,8 +664,7 @@ class Knight(Hero):
         Args:
             name: The knight's name
         """
-        image = pygame.image.load(resource_path("src\\game\\assets\\images\\knight.png")).convert()
-        image = pygame.transform.scale(image, (100, 100))
+        image = _portrait("knight")
         health = randint(10, 15)
         weapon = weapon_dictionary["Rusty Sword"]
         armor = armor_dictionary["Iron Chestplate"]
@@ -1,20 +1,26 @@
+import logging
 import pygame
 from src.game.core.constants import GameState, Colors
 from src.game.entities.monster import Monster
 from src.game.entities.hero import Hero
 from src.game.entities.items import potion_dictionary
-from src.game.entities.ability import DefendAbility, AttackAbility
+from src.game.entities.ability import Ability, DefendAbility, AttackAbility
 from src.game.ui.tooltip import Tooltip
-from enum import Enum
+from enum import IntEnum
 from src.game.managers.button_manager import ButtonManager
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
 
 
-class TurnState(Enum):
+_log = logging.getLogger(__name__)
+
+# Button name constants shared by the binding and update methods below
+_POTION_BTN_NAMES = ('Health Potion', 'Damage Potion', 'Block Potion')
+
+class TurnState(IntEnum):
     HERO_TURN = 0
     MONSTER_TURN = 1
 
-class BattleState(Enum):
+class BattleState(IntEnum):
     HOME = 0
     USE_ITEM = 1
     USE_ABILITY = 2
@@ -22,6 +28,17 @@ class BattleState(Enum):
     MONSTER_DEFEATED = 4
 
 class BattleManager:
+    __slots__ = (
+        'hero', 'battle_log', 'monster', '_state', '_turn', '_ui_dirty',
+        'showing_potions', 'button_manager', 'tooltip', '_buttons_bound',
+        '_ability_index', '_ability_index_len', '_ability_buttons_version',
+        '_tooltip_cache', '_state_handlers',
+        '_btn_ability', '_btn_rest', '_btn_potion', '_btn_flee',
+        '_btn_continue', '_btn_retreat',
+        '_combat_btns', '_victory_btns', '_non_ability_btns',
+        '_non_potion_btns', '_potion_btns',
+    )
+
     def __init__(self, hero: Hero, battle_log: List[str]) -> None:
         """Initialize the battle manager.
         
@@ -32,11 +49,90 @@ class BattleManager:
         self.hero: Hero = hero
         self.battle_log: List[str] = battle_log
         self.monster: Optional[Monster] = None
-        self.state: BattleState = BattleState.HOME
-        self.turn: TurnState = TurnState.HERO_TURN  # Start with hero's turn
+        self._state: BattleState = BattleState.HOME
+        self._turn: TurnState = TurnState.HERO_TURN  # Start with hero's turn
+        self._ui_dirty: bool = True  # Button states need recomputing
         self.showing_potions: bool = False  # Track if potion buttons are visible
         self.button_manager: Optional[ButtonManager] = None  # Store button manager reference
         self.tooltip: Optional[Tooltip] = None  # Store current tooltip
+        self._buttons_bound: bool = False  # Whether battle buttons are resolved
+        self._ability_index: Dict[str, Ability] = {}  # Name -> ability lookup
+        self._ability_index_len: int = -1  # Ability count the index was built for
+        self._ability_buttons_version: int = -1  # Ability count buttons were built for
+        self._tooltip_cache: Dict[Tuple[str, int], Tooltip] = {}  # (name, count) -> tooltip
+        # Dispatch table mapping (turn, state) to its button-update handler
+        self._state_handlers = {
+            (TurnState.HERO_TURN, BattleState.MONSTER_DEFEATED): self._ui_defeated,
+            (TurnState.MONSTER_TURN, BattleState.MONSTER_DEFEATED): self._ui_defeated,
+            (TurnState.MONSTER_TURN, BattleState.HOME): self._ui_monster_turn,
+            (TurnState.MONSTER_TURN, BattleState.USE_ITEM): self._ui_monster_turn,
+            (TurnState.MONSTER_TURN, BattleState.USE_ABILITY): self._ui_monster_turn,
+            (TurnState.MONSTER_TURN, BattleState.RUN_AWAY): self._ui_monster_turn,
+            (TurnState.HERO_TURN, BattleState.HOME): self._ui_home,
+            (TurnState.HERO_TURN, BattleState.USE_ABILITY): self._ui_use_ability,
+            (TurnState.HERO_TURN, BattleState.USE_ITEM): self._ui_use_item,
+            (TurnState.HERO_TURN, BattleState.RUN_AWAY): self._ui_lock_and_hide_victory,
+        }
+
+    @property
+    def state(self) -> BattleState:
+        """The current battle state."""
+        return self._state
+
+    @state.setter
+    def state(self, value: BattleState) -> None:
+        self._state = value
+        self._ui_dirty = True
+
+    @property
+    def turn(self) -> TurnState:
+        """Whose turn it currently is."""
+        return self._turn
+
+    @turn.setter
+    def turn(self, value: TurnState) -> None:
+        self._turn = value
+        self._ui_dirty = True
+
+    def _require_hero_turn(self, need_bm: bool = True) -> bool:
+        """Check that it is the hero's turn (and a button manager is bound).
+
+        Args:
+            need_bm: Whether a bound button manager is also required
+
+        Returns:
+            True if the guarded action may proceed
+        """
+        return self._turn is TurnState.HERO_TURN and (not need_bm or self.button_manager is not None)
+
+    def _refresh_ability_index(self) -> None:
+        """Rebuild the name -> ability lookup if the hero's abilities changed."""
+        if len(self.hero.abilities) != self._ability_index_len:
+            self._ability_index = {ability.name: ability for ability in self.hero.abilities}
+            self._ability_index_len = len(self.hero.abilities)
+
+    def _bind_buttons(self, button_manager: ButtonManager) -> None:
+        """Resolve every battle button once into direct references.
+
+        Looking buttons up through the manager walks a dict-of-dicts; the
+        per-frame update methods below use these cached references instead.
+
+        Args:
+            button_manager: The button manager to resolve buttons from
+        """
+        get = button_manager.get_button
+        self._btn_ability = get(GameState.BATTLE, 'Ability')
+        self._btn_rest = get(GameState.BATTLE, 'Rest')
+        self._btn_potion = get(GameState.BATTLE, 'Potion')
+        self._btn_flee = get(GameState.BATTLE, 'Flee')
+        self._btn_continue = get(GameState.BATTLE, 'Continue')
+        self._btn_retreat = get(GameState.BATTLE, 'Retreat')
+        self._combat_btns = (self._btn_ability, self._btn_rest, self._btn_potion, self._btn_flee)
+        self._victory_btns = (self._btn_continue, self._btn_retreat)
+        self._non_ability_btns = (self._btn_rest, self._btn_potion, self._btn_flee)
+        self._non_potion_btns = (self._btn_ability, self._btn_rest, self._btn_flee)
+        self._potion_btns = tuple(get(GameState.BATTLE, name) for name in _POTION_BTN_NAMES)
+        self._buttons_bound = True
 
     def start_battle(self, monster: Monster) -> None:
         """Initialize a new battle with a monster.
@@ -57,93 +153,104 @@ class BattleManager:
             False if hero was defeated
             None if battle continues
         """
-        # Only check for monster defeat if we're in an active battle
-        if self.state != BattleState.MONSTER_DEFEATED:
-            if self.hero.is_alive() and not self.monster.is_alive():
-                self.handle_monster_defeat()
-                return True  # Monster defeated
-            elif not self.hero.is_alive():
-                return False  # Hero defeated
+        # Only check for victory/defeat while a battle is actually running
+        if self.state is BattleState.MONSTER_DEFEATED or self.monster is None:
+            return None
+        hero_alive = self.hero.is_alive()
+        monster_alive = self.monster.is_alive()
+        if hero_alive and not monster_alive:
+            self.handle_monster_defeat()
+            return True  # Monster defeated
+        if not hero_alive:
+            return False  # Hero defeated
         return None  # Battle continues
 
     def handle_monster_defeat(self) -> None:
         """Handle monster defeat logic."""
         if not self.monster:
             return
-        self.battle_log.append(f"{self.monster.name} has been defeated!")
-        self.battle_log.append(f"{self.hero.name} gains {self.monster.experience} experience and {self.monster.gold} gold.")
+        self.battle_log.extend((
+            f"{self.monster.name} has been defeated!",
+            f"{self.hero.name} gains {self.monster.experience} experience and {self.monster.gold} gold.",
+        ))
         self.hero.gain_experience(self.monster.experience)
         self.hero.add_gold(self.monster.gold)
         self.state = BattleState.MONSTER_DEFEATED
 
     def update_button_states(self, button_manager: ButtonManager) -> None:
         """Update battle button states based on current turn and battle state.
-        
+
         Args:
             button_manager: The button manager to update button states
         """
-        # Store button manager reference for use in other methods
+        # Button states only change on discrete transitions; skip the work
+        # entirely when nothing has been marked dirty since the last update
+        if not self._ui_dirty and button_manager is self.button_manager:
+            return
+        if not self._buttons_bound or button_manager is not self.button_manager:
+            self._bind_buttons(button_manager)
         self.button_manager = button_manager
-        
-        if self.state == BattleState.MONSTER_DEFEATED:
-            # Lock combat buttons, unlock victory buttons
-            for name in ['Ability', 'Rest', 'Potion', 'Flee']:
-                button = button_manager.get_button(GameState.BATTLE, name)
-                button.lock()
-            for name in ['Continue', 'Retreat']:
-                button = button_manager.get_button(GameState.BATTLE, name)
-                button.unlock()
-            # Hide all utility buttons
-            self._toggle_potion_buttons(button_manager, False)
-            self._toggle_ability_buttons(button_manager, False)
+        self._ui_dirty = False
+
+        handler = self._state_handlers.get((self._turn, self._state), self._ui_home)
+        handler()
+
+    def _ui_lock_and_hide_victory(self) -> None:
+        """Lock and hide the victory buttons."""
+        for button in self._victory_btns:
+            button.lock()
+            button.hide()
+
+    def _ui_defeated(self) -> None:
+        """Lock combat buttons and unlock victory buttons after a kill."""
+        for button in self._combat_btns:
+            button.lock()
+        for button in self._victory_btns:
+            button.unlock()
+        # Hide all utility buttons
+        self._toggle_potion_buttons(self.button_manager, False)
+        self._toggle_ability_buttons(self.button_manager, False)
+
+    def _ui_monster_turn(self) -> None:
+        """Lock all hero action buttons during the monster's turn."""
+        self._ui_lock_and_hide_victory()
+        for button in self._combat_btns:
+            button.lock()
+        # Hide utility buttons
+        self._toggle_potion_buttons(self.button_manager, False)
+        self._toggle_ability_buttons(self.button_manager, False)
+
+    def _ui_home(self) -> None:
+        """Unlock the basic combat buttons for the hero's turn."""
+        self._ui_lock_and_hide_victory()
+        for button in self._non_potion_btns:
+            button.unlock()
+        # Handle potion button separately
+        if self.hero.has_potions():
+            self._btn_potion.unlock()
         else:
-            # Lock victory buttons
-            for name in ['Continue', 'Retreat']:
-                button = button_manager.get_button(GameState.BATTLE, name)
-                button.lock()
-                button.hide()
+            self._btn_potion.lock()
+        # Hide both utility buttons in home state
+        self._toggle_potion_buttons(self.button_manager, False)
+        self._toggle_ability_buttons(self.button_manager, False)
 
-            if self.turn == TurnState.MONSTER_TURN:
-                # Lock all hero action buttons during monster's turn
-                for name in ['Ability', 'Rest', 'Potion', 'Flee']:
-                    button = button_manager.get_button(GameState.BATTLE, name)
-                    button.lock()
-                # Hide utility buttons
-                self._toggle_potion_buttons(button_manager, False)
-                self._toggle_ability_buttons(button_manager, False)
-                self.start_monster_turn()
-            else:  # Hero's turn
-                if self.state == BattleState.HOME:
-                    # Unlock basic combat buttons
-                    for name in ['Ability', 'Rest', 'Flee']:
-                        button = button_manager.get_button(GameState.BATTLE, name)
-                        button.unlock()
-                    # Handle potion button separately
-                    potions_button = button_manager.get_button(GameState.BATTLE, "Potion")
-                    if self.hero.has_potions():
-                        potions_button.unlock()
-                    else:
-                        potions_button.lock()
-                    # Hide both utility buttons in home state
-                    self._toggle_potion_buttons(button_manager, False)
-                    self._toggle_ability_buttons(button_manager, False)
-                elif self.state == BattleState.USE_ABILITY:
-                    # Lock basic combat buttons except Ability
-                    for name in ['Rest', 'Potion', 'Flee']:
-                        button = button_manager.get_button(GameState.BATTLE, name)
-                        button.lock()
-                    # Show ability buttons and update their states
-                    self._toggle_potion_buttons(button_manager, False)
-                    self._toggle_ability_buttons(button_manager, True)
-                elif self.state == BattleState.USE_ITEM:
-                    # Lock basic combat buttons except Potion
-                    for name in ['Ability', 'Rest', 'Flee']:
-                        button = button_manager.get_button(GameState.BATTLE, name)
-                        button.lock()
-                    # Show potion selection buttons
-                    self._toggle_potion_buttons(button_manager, True)
-                    self._toggle_ability_buttons(button_manager, False)
+    def _ui_use_ability(self) -> None:
+        """Show the ability selection buttons."""
+        self._ui_lock_and_hide_victory()
+        # Lock basic combat buttons except Ability
+        for button in self._non_ability_btns:
+            button.lock()
+        self._toggle_potion_buttons(self.button_manager, False)
+        self._toggle_ability_buttons(self.button_manager, True)
 
+    def _ui_use_item(self) -> None:
+        """Show the potion selection buttons."""
+        self._ui_lock_and_hide_victory()
+        # Lock basic combat buttons except Potion
+        for button in self._non_potion_btns:
+            button.lock()
+        self._toggle_potion_buttons(self.button_manager, True)
+        self._toggle_ability_buttons(self.button_manager, False)
 
     def get_potion_tooltip(self, potion_name: str) -> Optional[Tooltip]:
         """Get tooltip for a potion button.
@@ -155,8 +262,15 @@ class BattleManager:
             Tooltip object if potion exists, None otherwise
         """
         if self.button_manager and potion_name in potion_dictionary:
-            potion = potion_dictionary[potion_name]
-            return Tooltip(f"{potion.description} (x{self.hero.potion_bag[potion_name]})", self.button_manager.font)
+            # Keyed by count so a used potion naturally gets a fresh tooltip
+            count = self.hero.potion_bag.get(potion_name, 0)
+            key = (potion_name, count)
+            tooltip = self._tooltip_cache.get(key)
+            if tooltip is None:
+                potion = potion_dictionary[potion_name]
+                tooltip = Tooltip(f"{potion.description} (x{count})", self.button_manager.font)
+                self._tooltip_cache[key] = tooltip
+            return tooltip
         return None
 
     def _toggle_potion_buttons(self, button_manager: ButtonManager, show: bool) -> None:
@@ -167,8 +281,7 @@ class BattleManager:
             show: Whether to show or hide the buttons
         """
         self.showing_potions = show
-        for name in ['Health Potion', 'Damage Potion', 'Block Potion']:
-            button = button_manager.get_button(GameState.BATTLE, name)
+        for button in self._potion_btns:
             if show:
                 button.show()
             else:
@@ -180,39 +293,48 @@ class BattleManager:
         Args:
             button_manager: The button manager to update button states
         """
-        for potion_name in ['Health Potion', 'Damage Potion', 'Block Potion']:
-            button = button_manager.get_button(GameState.BATTLE, potion_name)
-            if self.hero.potion_bag[potion_name] > 0:
-                button.unlock()
-            else:
+        # Empty bag means every button locks; skip the per-potion lookups
+        if not self.hero.has_potions():
+            for button in self._potion_btns:
                 button.lock()
+            return
+        bag = self.hero.potion_bag
+        for potion_name, button in zip(_POTION_BTN_NAMES, self._potion_btns):
+            (button.unlock if bag.get(potion_name, 0) > 0 else button.lock)()
 
     def handle_monster_attack(self) -> None:
         """Handle monster's attack action."""
-        if self.turn != TurnState.MONSTER_TURN:
+        if self.turn is not TurnState.MONSTER_TURN:
             return  # Not monster's turn
-            
-        if self.monster and self.monster.is_alive():
-            # Calculate damage after hero's block
-            damage = max(0, self.monster.damage - self.hero.potion_block)
-            self.hero.take_damage(damage)
-            
-            # Create battle log message
-            if self.hero.potion_block > 0:
-                self.battle_log.append(f"{self.hero.name} blocks {self.hero.potion_block} damage!")
-                self.battle_log.append(f"{self.monster.name} attacks {self.hero.name} for {damage} damage.")
-            else:
-                self.battle_log.append(f"{self.monster.name} attacks {self.hero.name} for {damage} damage.")
-            
-            # Reset hero's block after the attack
-            self.hero.potion_block = 0
-            
-            # Switch back to hero's turn
-            self.turn = TurnState.HERO_TURN
 
-    def start_monster_turn(self) -> None:
-        """Handle the monster's turn."""
-        if self.monster and self.monster.is_alive():
+        monster = self.monster
+        if monster is None or not monster.is_alive():
+            return
+        hero = self.hero
+
+        # Calculate damage after hero's block
+        block = hero.potion_block
+        damage = monster.damage - block
+        if damage < 0:
+            damage = 0
+        hero.take_damage(damage)
+
+        # Create battle log message, folding any block into a single line
+        prefix = f"{hero.name} blocks {block} damage! " if block else ""
+        self.battle_log.append(f"{prefix}{monster.name} attacks {hero.name} for {damage} damage.")
+
+        # Reset hero's block after the attack
+        hero.potion_block = 0
+
+        # Switch back to hero's turn
+        self.turn = TurnState.HERO_TURN
+
+    def _end_hero_turn(self) -> None:
+        """Return to the home state and hand the turn to the monster."""
+        self.state = BattleState.HOME
+        self.turn = TurnState.MONSTER_TURN
+        monster = self.monster
+        if monster is not None and monster.is_alive():
             self.handle_monster_attack()
 
     def handle_ability(self, ability_name: Optional[str] = None) -> None:
@@ -222,7 +344,7 @@ class BattleManager:
             ability_name: Optional name of ability to use. If provided, use the ability.
                         If not provided, toggle ability selection mode.
         """
-        if self.turn != TurnState.HERO_TURN or not self.button_manager:
+        if not self._require_hero_turn():
             return  # Not hero's turn or no button manager
 
         # If ability name is provided, use that ability
@@ -231,7 +353,7 @@ class BattleManager:
             return
             
         # Toggle between showing and hiding ability buttons
-        if self.state == BattleState.USE_ABILITY:
+        if self.state is BattleState.USE_ABILITY:
             self.state = BattleState.HOME
             self._toggle_ability_buttons(self.button_manager, False)
         else:
@@ -242,26 +364,23 @@ class BattleManager:
 
     def handle_rest(self) -> None:
         """Handle hero's Rest action."""
-        if self.turn != TurnState.HERO_TURN:
+        if not self._require_hero_turn(need_bm=False):
             return  # Not hero's turn
-        print("The Hero rests restoring his energy")
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("Hero %s rests", self.hero.name)
         self.hero.rest()
         self.battle_log.append(f"{self.hero.name} rests to restore energy.")
 
-        # Return to normal battle state and switch turns
-        self.state = BattleState.HOME
-        self.turn = TurnState.MONSTER_TURN
-        
-        if self.monster and self.monster.is_alive():
-            self.start_monster_turn()
+        # Return to normal battle state and hand the turn over
+        self._end_hero_turn()
 
     def handle_use_potion(self) -> None:
         """Handle hero's potion use."""
-        if self.turn != TurnState.HERO_TURN or not self.button_manager:
+        if not self._require_hero_turn():
             return  # Not hero's turn or no button manager
-            
+
         # Toggle between showing and hiding potion buttons
-        if self.state == BattleState.USE_ITEM:
+        if self.state is BattleState.USE_ITEM:
             self.state = BattleState.HOME
             self._toggle_potion_buttons(self.button_manager, False)
         else:
@@ -277,7 +396,7 @@ class BattleManager:
         Args:
             potion_name: Name of the potion to use
         """
-        if self.turn != TurnState.HERO_TURN or self.state != BattleState.USE_ITEM or not self.button_manager:
+        if not self._require_hero_turn() or self.state is not BattleState.USE_ITEM:
             return  # Not in correct state to use potion
             
         self.hero.use_potion(potion_name)
@@ -285,12 +404,9 @@ class BattleManager:
         
         # Hide potion buttons after use
         self._toggle_potion_buttons(self.button_manager, False)
-        
-        # Return to normal battle state and switch turns
-        self.state = BattleState.HOME
-        self.turn = TurnState.MONSTER_TURN
-        if self.monster and self.monster.is_alive():
-            self.start_monster_turn()
+
+        # Return to normal battle state and hand the turn over
+        self._end_hero_turn()
 
     def handle_flee(self) -> bool:
         """Handle hero's flee action.
@@ -298,7 +414,7 @@ class BattleManager:
         Returns:
             bool: True if flee was successful, False otherwise
         """
-        if self.turn != TurnState.HERO_TURN:
+        if not self._require_hero_turn(need_bm=False):
             return False  # Not hero's turn
         self.state = BattleState.RUN_AWAY
         return True  # Successful flee
@@ -309,26 +425,23 @@ class BattleManager:
         Args:
             ability_name: Name of the ability to use
         """
-        if self.turn != TurnState.HERO_TURN or self.state != BattleState.USE_ABILITY or not self.button_manager:
+        if not self._require_hero_turn() or self.state is not BattleState.USE_ABILITY:
             return
 
-        if self.monster and self.monster.is_alive():            # Find the ability first to check requirements
-            target_ability = None
-            for ability in self.hero.abilities:
-                if ability.name == ability_name:
-                    if not ability.can_use(self.hero):
-                        self.battle_log.append(f"{ability_name} is still on cooldown!")
-                        return
-                    if self.hero.energy < ability.energy_cost:
-                        self.battle_log.append(f"Not enough energy to use {ability_name}!")
-                        return
-                    target_ability = ability
-                    break
-            
-            if not target_ability:
+        if self.monster and self.monster.is_alive():
+            # Find the ability first to check requirements
+            self._refresh_ability_index()
+            target_ability = self._ability_index.get(ability_name)
+            if target_ability is None:
                 self.battle_log.append(f"{self.hero.name} doesn't know {ability_name}!")
                 return
-                    
+            if not target_ability.can_use(self.hero):
+                self.battle_log.append(f"{ability_name} is still on cooldown!")
+                return
+            if self.hero.energy < target_ability.energy_cost:
+                self.battle_log.append(f"Not enough energy to use {ability_name}!")
+                return
+
             # Now try to use the ability
             effect = target_ability.use(self.hero, self.monster)
             self.hero.energy -= target_ability.energy_cost
@@ -350,14 +463,9 @@ class BattleManager:
 
             # Update ability cooldowns at the end of the heros turn
             self.hero.update_abilities()
-            
-            # Return to normal battle state and switch turns
-            self.state = BattleState.HOME
-            self.turn = TurnState.MONSTER_TURN
-            
-            # Start monster turn if it's still alive
-            if self.monster.is_alive():
-                self.start_monster_turn()
+
+            # Return to normal battle state and hand the turn over
+            self._end_hero_turn()
 
     def _toggle_ability_buttons(self, button_manager: ButtonManager, show: bool) -> None:
         """Show or hide ability selection buttons.
@@ -366,14 +474,20 @@ class BattleManager:
             button_manager: The button manager to update button states
             show: Whether to show or hide the buttons
         """
-        # Clear existing buttons first
-        button_manager.clear_hero_ability_buttons()
-        
-        if show:
-            # Create ability buttons for hero's abilities
+        # Rebuild the buttons only when the hero's ability list has changed
+        if len(self.hero.abilities) != self._ability_buttons_version:
+            button_manager.clear_hero_ability_buttons()
             for ability in self.hero.abilities:
                 button_manager.add_hero_ability_button(ability)
-                
+            self._ability_buttons_version = len(self.hero.abilities)
+
+        for button in button_manager.hero_ability_buttons.buttons:
+            if show:
+                button.show()
+            else:
+                button.hide()
+
+        if show:
             # Update button states based on cooldowns and energy costs
             self._update_ability_button_states(button_manager)
 
@@ -384,12 +498,13 @@ class BattleManager:
             button_manager: The button manager to update button states
         """
         # Update each button's state based on ability status
-        for button in button_manager.hero_ability_buttons.buttons:                
-            for ability in self.hero.abilities:
-                if button.text == ability.name:
-                    # Lock button if ability is on cooldown or hero lacks energy
-                    if ability.current_cooldown > 0 or self.hero.energy < ability.energy_cost:
-                        button.lock()
-                    else:
-                        button.unlock()
-                    break
\ No newline at end of file
+        self._refresh_ability_index()
+        for button in button_manager.hero_ability_buttons.buttons:
+            ability = self._ability_index.get(button.text)
+            if ability is None:
+                continue
+            # Lock button if ability is on cooldown or hero lacks energy
+            if ability.current_cooldown > 0 or self.hero.energy < ability.energy_cost:
+                button.lock()
+            else:
+                button.unlock()
\ No newline at end of file
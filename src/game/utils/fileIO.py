@@ -1,10 +1,21 @@
+import functools
 import json
 import os
+import pickle
 import sys
 
+# Pickled saves are written to the .dat file; the .json file is the legacy
+# format kept readable for old saves.
+SAVE_FILE = "savefile.dat"
+LEGACY_SAVE_FILE = "savefile.json"
 
+
+@functools.lru_cache(maxsize=None)
 def resource_path(relative_path: str) -> str:
-    """Get the absolute path to the resource, works for dev and PyInstaller."""
+    """Get the absolute path to the resource, works for dev and PyInstaller.
+
+    Resource paths never change during a run, so results are memoized.
+    """
     try:
         base_path = sys._MEIPASS
     except Exception:
@@ -14,31 +25,38 @@ def resource_path(relative_path: str) -> str:
 def save_game(save_data):
     """Save the hero's progress to a file."""
     try:
-        with open("savefile.json", "w") as savefile:
-            # Convert hero object to a dictionary and save it as JSON
-            json.dump(save_data, savefile, indent=4)
+        with open(SAVE_FILE, "wb", buffering=1 << 16) as savefile:
+            # Highest protocol gives the smallest and fastest pickle stream
+            pickle.dump(save_data, savefile, protocol=pickle.HIGHEST_PROTOCOL)
         print("Game saved successfully!")
     except Exception as e:
         print(f"Error saving game: {e}")
 
 def save_file_exists() -> bool:
     """Check if a save file exists.
-    
+
     Returns:
         bool: True if save file exists, False otherwise
     """
-    return os.path.exists("savefile.json")
+    return os.path.exists(SAVE_FILE) or os.path.exists(LEGACY_SAVE_FILE)
 
 def load_game() -> dict:
     """Load the hero's progress from a file."""
     try:
-        with open("savefile.json", "r") as savefile:
-            # Load the hero data from the JSON file
-            data = json.load(savefile)
-            return data
+        with open(SAVE_FILE, "rb", buffering=1 << 16) as savefile:
+            return pickle.load(savefile)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"Error loading game: {e}")
+        return None
+    # Fall back to the legacy JSON save format
+    try:
+        with open(LEGACY_SAVE_FILE, "r") as savefile:
+            return json.load(savefile)
     except FileNotFoundError:
         print("No save file found. Starting a new game.")
         return None
     except Exception as e:
         print(f"Error loading game: {e}")
-        return None
\ No newline at end of file
+        return None